@@ -3,8 +3,10 @@
 
 import sys
 import logging
-from datetime import datetime
-from datetime import timedelta
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import re
 from ipaddress import ip_network
 import requests
@@ -17,6 +19,21 @@ urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on concurrent APIC requests when independent queries are fanned out in threads.
+MAX_CONCURRENT_REQUESTS = 8
+
+# Precompiled DN patterns used in the get_static_path() hot loop.
+# \d+ rather than [0-9]: the original patterns only matched single-digit pod IDs.
+PATHS_RE = re.compile(r"topology/pod-\d+/paths-\d+")
+PROTPATHS_RE = re.compile(r"topology/pod-\d+/protpaths-\d+-\d+")
+IFSELECTOR_RE = re.compile(r"-(.*)/")
+
+
+@lru_cache(maxsize=1024)
+def _ip_network_cached(value):
+    """Parse a network string once; nodes in the same pod all share the same tepPool."""
+    return ip_network(value, strict=False)
+
 
 class RequestConnectError(Exception):
     """Exception class to be raised upon requests module connection errors."""
@@ -44,9 +61,29 @@ class AciApi:
         self.base_uri = base_uri
         self.verify = verify
         self.site = site
-        self.cookies = ""
         self.last_login = None
         self.refresh_timeout = None
+        self._refresh_deadline = None
+        # Serializes login refreshes when requests are fanned out across threads, so an
+        # expired token triggers one aaaLogin rather than a burst the APIC may rate-limit.
+        self._login_lock = threading.Lock()
+        # A persistent session reuses one TLS connection (and tracks the APIC auth cookie)
+        # across all calls instead of a TCP+TLS handshake per request.
+        self.session = requests.Session()
+        self.session.verify = self.verify
+        adapter = requests.adapters.HTTPAdapter(
+            pool_maxsize=MAX_CONCURRENT_REQUESTS,
+            max_retries=urllib3.util.retry.Retry(
+                total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504]
+            ),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        # Many EPGs reference the same contracts and bridge domains; memoize those lookups
+        # per instance so each one costs a single APIC round trip per sync run.
+        self._contract_filter_cache = {}
+        self._bd_subnet_cache = {}
+        self._filter_entries_cache = {}
 
     def _login(self):
         """Method to log into the ACI fabric and retrieve the token."""
@@ -54,20 +91,20 @@ class AciApi:
         url = self.base_uri + "/api/aaaLogin.json"
         resp = self._handle_request(url, request_type="post", data=payload)
         if resp.ok:
-            self.cookies = resp.cookies
-            self.last_login = datetime.now()
             self.refresh_timeout = int(resp.json()["imdata"][0]["aaaLogin"]["attributes"]["refreshTimeoutSeconds"])
+            # Monotonic clock: immune to wall-clock adjustments, and the check on every
+            # request reduces to a single float comparison.
+            self.last_login = time.monotonic()
+            self._refresh_deadline = self.last_login + self.refresh_timeout
         return resp
 
     def _handle_request(self, url: str, params: dict = None, request_type: str = "get", data: dict = None) -> object:
         """Send a REST API call to the APIC."""
         try:
-            resp = requests.request(
+            resp = self.session.request(
                 method=request_type,
                 url=url,
-                cookies=self.cookies,
                 params=params,
-                verify=self.verify,
                 json=data,
                 timeout=30,
             )
@@ -79,10 +116,8 @@ class AciApi:
         """Private method to check if the login token needs refreshed. Returns True if login needs refresh."""
         if not self.last_login:
             return True
-        # if time diff b/w now and last login greater than refresh_timeout then refresh login
-        if datetime.now() - self.last_login > timedelta(seconds=self.refresh_timeout):
-            return True
-        return False
+        # if time elapsed since last login is greater than refresh_timeout then refresh login
+        return time.monotonic() > self._refresh_deadline
 
     def _handle_error(self, response: object):
         """Private method to handle HTTP errors."""
@@ -92,37 +127,27 @@ class AciApi:
             f"Error: {response.status_code}, Reason: {response.reason}"
         )
 
-    def _get(self, uri: str, params: dict = None) -> object:
-        """Method to retrieve data from the ACI fabric."""
-        url = self.base_uri + uri
+    def _request(self, uri: str, params: dict = None, request_type: str = "get", data: dict = None) -> object:
+        """Refresh the login if needed, then issue a request and raise on HTTP errors."""
         if self._refresh_token():
-            login_resp = self._login()
-            if login_resp.ok:
-                resp = self._handle_request(url, params)
-                if resp.ok:
-                    return resp
-                return self._handle_error(resp)
-            return self._handle_error(login_resp)
-        resp = self._handle_request(url, params)
+            with self._login_lock:
+                # Double-checked: another worker may have refreshed while we waited
+                if self._refresh_token():
+                    login_resp = self._login()
+                    if not login_resp.ok:
+                        return self._handle_error(login_resp)
+        resp = self._handle_request(self.base_uri + uri, params, request_type=request_type, data=data)
         if resp.ok:
             return resp
         return self._handle_error(resp)
 
+    def _get(self, uri: str, params: dict = None) -> object:
+        """Method to retrieve data from the ACI fabric."""
+        return self._request(uri, params)
+
     def _post(self, uri: str, params: dict = None, data=None) -> object:
         """Method to post data to the ACI fabric."""
-        url = self.base_uri + uri
-        if self._refresh_token():
-            login_resp = self._login()
-            if login_resp.ok:
-                resp = self._handle_request(url, params, request_type="post", data=data)
-                if resp.ok:
-                    return resp
-                return self._handle_error(resp)
-            return self._handle_error(login_resp)
-        resp = self._handle_request(url, params, request_type="post", data=data)
-        if resp.ok:
-            return resp
-        return self._handle_error(resp)
+        return self._request(uri, params, request_type="post", data=data)
 
     def get_tenants(self) -> list:
         """Retrieve the list of tenants from the ACI fabric."""
@@ -158,57 +183,74 @@ class AciApi:
                 f"/api/node/mo/uni/tn-{tenant}/ap-{ap}.json?query-target=children&target-subtree-class=fvAEPg"
             )
 
-        if tenant == "all":
-            epg_list = [
-                {
-                    "tenant": tenant_from_dn(data["fvAEPg"]["attributes"]["dn"]),
-                    "ap": ap_from_dn(data["fvAEPg"]["attributes"]["dn"]),
-                    "epg": data["fvAEPg"]["attributes"]["name"],
-                }
-                for data in resp.json()["imdata"]
-            ]
-        else:
-            epg_list = [
-                {
-                    "tenant": tenant_from_dn(data["fvAEPg"]["attributes"]["dn"]),
-                    "ap": ap_from_dn(data["fvAEPg"]["attributes"]["dn"]),
-                    "epg": data["fvAEPg"]["attributes"]["name"],
-                }
-                for data in resp.json()["imdata"]
-                if tenant_from_dn(data["fvAEPg"]["attributes"]["dn"]) == tenant
-            ]
+        epg_list = []
+        for data in resp.json()["imdata"]:
+            attrs = data["fvAEPg"]["attributes"]
+            # Parse each DN once; the tenant filter and the result reuse the same values
+            epg_tenant = tenant_from_dn(attrs["dn"])
+            if tenant != "all" and epg_tenant != tenant:
+                continue
+            epg_list.append({"tenant": epg_tenant, "ap": ap_from_dn(attrs["dn"]), "epg": attrs["name"]})
         return epg_list
 
+    def clear_caches(self):
+        """Drop memoized contract-filter and BD-subnet lookups, e.g. between sync runs."""
+        self._contract_filter_cache.clear()
+        self._bd_subnet_cache.clear()
+        self._filter_entries_cache.clear()
+
     def get_bd_subnet(self, tenant: str, bd: str) -> list:
         """Returns the subnet(s) of a BD, or None."""
+        cache_key = (tenant, bd)
+        if cache_key in self._bd_subnet_cache:
+            return self._bd_subnet_cache[cache_key]
         resp = self._get(
             f"/api/node/mo/uni/tn-{tenant}/BD-{bd}.json?query-target=children&target-subtree-class=fvSubnet"
         )
-        if int(resp.json()["totalCount"]) > 0:
-            subnet_list = [data["fvSubnet"]["attributes"]["ip"] for data in resp.json()["imdata"]]
+        # Parse the body once; each resp.json() call re-runs json.loads on the full payload
+        payload = resp.json()
+        if int(payload["totalCount"]) > 0:
+            subnet_list = [data["fvSubnet"]["attributes"]["ip"] for data in payload["imdata"]]
+            self._bd_subnet_cache[cache_key] = subnet_list
             return subnet_list
+        self._bd_subnet_cache[cache_key] = None
         return None
 
     def get_contract_filters(self, tenant, contract_name: str) -> list:
         """Returns filters for a specified contract."""
+        cache_key = (tenant, contract_name)
+        if cache_key in self._contract_filter_cache:
+            return self._contract_filter_cache[cache_key]
+        # One subtree query on the contract returns the filter attachments of every
+        # subject at once, replacing the subject listing and per-subject round trips.
         resp = self._get(
-            f"/api/node/mo/uni/tn-{tenant}/brc-{contract_name}.json?query-target=subtree&target-subtree-class=vzSubj"
+            f"/api/node/mo/uni/tn-{tenant}/brc-{contract_name}.json"
+            "?query-target=subtree&target-subtree-class=vzRsSubjFiltAtt"
         )
-        subj_list = [subj_dn["vzSubj"]["attributes"]["dn"] for subj_dn in resp.json()["imdata"]]
         filter_list = []
-        for dn in subj_list:
-            subj_resp = self._get(f"/api/node/mo/{dn}.json?query-target=subtree&target-subtree-class=vzRsSubjFiltAtt")
-            for fltr in subj_resp.json()["imdata"]:
-                fltr_dn = fltr["vzRsSubjFiltAtt"]["attributes"]["tDn"]
-                entry_resp = self._get(f"/api/node/mo/{fltr_dn}.json?query-target=subtree&target-subtree-class=vzEntry")
-                for entry in entry_resp.json()["imdata"]:
-                    fltr_dict = {}
-                    fltr_dict["name"] = entry["vzEntry"]["attributes"]["name"]
-                    fltr_dict["dstport"] = entry["vzEntry"]["attributes"]["dToPort"]
-                    fltr_dict["etype"] = entry["vzEntry"]["attributes"]["etherT"]
-                    fltr_dict["prot"] = entry["vzEntry"]["attributes"]["prot"]
-                    fltr_dict["action"] = fltr["vzRsSubjFiltAtt"]["attributes"]["action"]
-                    filter_list.append(fltr_dict)
+        for fltr in resp.json()["imdata"]:
+            fltr_attrs = fltr["vzRsSubjFiltAtt"]["attributes"]
+            fltr_dn = fltr_attrs["tDn"]
+            # Contracts frequently attach the same filter (often from tn-common); fetch
+            # each unique filter's entries once per instance.
+            entries = self._filter_entries_cache.get(fltr_dn)
+            if entries is None:
+                entry_resp = self._get(
+                    f"/api/node/mo/{fltr_dn}.json?query-target=subtree&target-subtree-class=vzEntry"
+                )
+                entries = [entry["vzEntry"]["attributes"] for entry in entry_resp.json()["imdata"]]
+                self._filter_entries_cache[fltr_dn] = entries
+            for entry_attrs in entries:
+                filter_list.append(
+                    {
+                        "name": entry_attrs["name"],
+                        "dstport": entry_attrs["dToPort"],
+                        "etype": entry_attrs["etherT"],
+                        "prot": entry_attrs["prot"],
+                        "action": fltr_attrs["action"],
+                    }
+                )
+        self._contract_filter_cache[cache_key] = filter_list
         return filter_list
 
     def get_static_path(self, tenant: str, ap: str, epg: str) -> list:
@@ -223,20 +265,22 @@ class AciApi:
             if "paths" in tDn and "protpaths" not in tDn:
                 # port on a single node
                 sp_dict["type"] = "non-PC"
-                pattern = "topology/pod-[0-9]/paths-[0-9]+"
-                resp = self._get(f"/api/node/mo/{re.match(pattern, tDn).group()}.json")
+                resp = self._get(f"/api/node/mo/{PATHS_RE.match(tDn).group()}.json")
                 sp_dict["node_id"] = resp.json()["imdata"][0]["fabricPathEpCont"]["attributes"]["nodeId"]
                 resp = self._get(f"/api/node/mo/{tDn}.json")
-                sp_dict["intf"] = resp.json()["imdata"][0]["fabricPathEp"]["attributes"]["name"]
-                sp_dict["pathtype"] = resp.json()["imdata"][0]["fabricPathEp"]["attributes"]["pathT"]
+                # Bind the attributes dict once instead of re-walking the decoded body per field
+                path_ep = resp.json()["imdata"][0]["fabricPathEp"]["attributes"]
+                sp_dict["intf"] = path_ep["name"]
+                sp_dict["pathtype"] = path_ep["pathT"]
                 sp_list.append(sp_dict)
             if "protpaths" in tDn:
                 # PortChannel or vPC
-                pattern = "topology/pod-[0-9]/protpaths-[0-9]+-[0-9]+"
-                resp = self._get(f"/api/node/mo/{re.match(pattern, tDn).group()}.json")
-                if len(resp.json()["imdata"]) > 0:
-                    sp_dict["node_a"] = resp.json()["imdata"][0]["fabricProtPathEpCont"]["attributes"]["nodeAId"]
-                    sp_dict["node_b"] = resp.json()["imdata"][0]["fabricProtPathEpCont"]["attributes"]["nodeBId"]
+                resp = self._get(f"/api/node/mo/{PROTPATHS_RE.match(tDn).group()}.json")
+                prot_paths = resp.json()["imdata"]
+                if len(prot_paths) > 0:
+                    prot_path_cont = prot_paths[0]["fabricProtPathEpCont"]["attributes"]
+                    sp_dict["node_a"] = prot_path_cont["nodeAId"]
+                    sp_dict["node_b"] = prot_path_cont["nodeBId"]
                     if sp_dict["node_a"] == sp_dict["node_b"]:
                         sp_dict["type"] = "PC"
                     else:
@@ -251,8 +295,7 @@ class AciApi:
                     sp_dict["node_b_intfs"] = []
                     for data in resp.json()["imdata"]:
                         tDn = data["infraRtAccBaseGrp"]["attributes"]["tDn"]
-                        pattern = "-.*/"
-                        ifselector = re.search(pattern, tDn).group().lstrip("-").rstrip("/")
+                        ifselector = IFSELECTOR_RE.search(tDn).group(1)
                         resp = self._get(
                             f"/api/node/mo/{tDn}.json?query-target=subtree&target-subtree-class=infraPortBlk"
                         )
@@ -289,29 +332,47 @@ class AciApi:
             "static_paths": [],
         }
         epg_dict["name"] = epg
+        consumed_contracts = []
+        provided_contracts = []
+        has_static_paths = False
         for obj in resp.json()["imdata"]:
             if "fvRsBd" in obj:
                 epg_dict["bd"] = obj["fvRsBd"]["attributes"]["tnFvBDName"]
                 epg_dict["subnets"] = self.get_bd_subnet(tenant, epg_dict["bd"])
             if "fvRsCons" in obj:
-                epg_dict["consumed_contracts"].append(
-                    {
-                        "name": obj["fvRsCons"]["attributes"]["tnVzBrCPName"],
-                        "filters": self.get_contract_filters(tenant, obj["fvRsCons"]["attributes"]["tnVzBrCPName"]),
-                    }
-                )
+                consumed_contracts.append(obj["fvRsCons"]["attributes"]["tnVzBrCPName"])
             if "fvRsProv" in obj:
-                epg_dict["provided_contracts"].append(
-                    {
-                        "name": obj["fvRsProv"]["attributes"]["tnVzBrCPName"],
-                        "filters": self.get_contract_filters(tenant, obj["fvRsProv"]["attributes"]["tnVzBrCPName"]),
-                    }
-                )
+                provided_contracts.append(obj["fvRsProv"]["attributes"]["tnVzBrCPName"])
             if "fvRsDomAtt" in obj:
-                resp = self._get(f"/api/node/mo/{obj['fvRsDomAtt']['attributes']['tDn']}.json")
-                epg_dict["domains"].append(resp.json()["imdata"][0]["physDomP"]["attributes"]["name"])
+                # The physical domain name is already encoded in the attachment's tDn
+                # (uni/phys-<name>); only fall back to a lookup for other domain types.
+                dom_tdn = obj["fvRsDomAtt"]["attributes"]["tDn"]
+                if dom_tdn.startswith("uni/phys-"):
+                    epg_dict["domains"].append(dom_tdn[len("uni/phys-") :])
+                else:
+                    dom_resp = self._get(f"/api/node/mo/{dom_tdn}.json")
+                    epg_dict["domains"].append(dom_resp.json()["imdata"][0]["physDomP"]["attributes"]["name"])
             if "fvRsPathAtt" in obj:
-                epg_dict["static_paths"] = self.get_static_path(tenant, ap, epg)
+                has_static_paths = True
+        # The per-contract filter lookups are independent APIC round trips, so fan them out
+        # across a bounded thread pool instead of fetching them one at a time.
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+            epg_dict["consumed_contracts"] = [
+                {"name": name, "filters": filters}
+                for name, filters in zip(
+                    consumed_contracts,
+                    executor.map(lambda name: self.get_contract_filters(tenant, name), consumed_contracts),
+                )
+            ]
+            epg_dict["provided_contracts"] = [
+                {"name": name, "filters": filters}
+                for name, filters in zip(
+                    provided_contracts,
+                    executor.map(lambda name: self.get_contract_filters(tenant, name), provided_contracts),
+                )
+            ]
+        if has_static_paths:
+            epg_dict["static_paths"] = self.get_static_path(tenant, ap, epg)
         return epg_dict
 
     def get_vrfs(self, tenant: str) -> list:
@@ -328,81 +389,81 @@ class AciApi:
 
     def get_bds(self, tenant: str) -> dict:
         """Return Bridge Domains and Subnets from the Cisco APIC."""
+        # Have the APIC embed each BD's VRF relation and subnets as children so the whole
+        # inventory arrives in one round trip rather than two follow-up calls per BD.
+        subtree = "rsp-subtree=children&rsp-subtree-class=fvRsCtx,fvSubnet"
         if tenant == "all":
-            resp = self._get("/api/node/class/fvBD.json")
+            resp = self._get(f"/api/node/class/fvBD.json?{subtree}")
         else:
-            resp = self._get(f"/api/node/mo/uni/tn-{tenant}.json?query-target=children&target-subtree-class=fvBD")
+            resp = self._get(
+                f"/api/node/mo/uni/tn-{tenant}.json?query-target=children&target-subtree-class=fvBD&{subtree}"
+            )
 
         bd_dict = {}
         for data in resp.json()["imdata"]:
-            bd_dict.setdefault(data["fvBD"]["attributes"]["name"], {})
-            bd_dict[data["fvBD"]["attributes"]["name"]]["tenant"] = tenant_from_dn(data["fvBD"]["attributes"]["dn"])
-            bd_dict[data["fvBD"]["attributes"]["name"]]["description"] = data["fvBD"]["attributes"]["descr"]
-            bd_dict[data["fvBD"]["attributes"]["name"]]["unicast_routing"] = data["fvBD"]["attributes"]["unicastRoute"]
-            bd_dict[data["fvBD"]["attributes"]["name"]]["mac"] = data["fvBD"]["attributes"]["mac"]
-            bd_dict[data["fvBD"]["attributes"]["name"]]["l2unicast"] = data["fvBD"]["attributes"]["unkMacUcastAct"]
-
-        for key, value in bd_dict.items():
-            # get the containing VRF
-            resp = self._get(
-                f"/api/node/mo/uni/tn-{value['tenant']}/BD-{key}.json?query-target=children&target-subtree-class=fvRsCtx"
-            )
-            for data in resp.json()["imdata"]:
-                value["vrf"] = data["fvRsCtx"]["attributes"].get("tnFvCtxName", "default")
-                vrf_tenant = data["fvRsCtx"]["attributes"].get("tDn", None)
-                if vrf_tenant:
-                    value["vrf_tenant"] = tenant_from_dn(vrf_tenant)
-                else:
-                    value["vrf_tenant"] = None
-            # get subnets
-            resp = self._get(
-                f"/api/node/mo/uni/tn-{value['tenant']}/BD-{key}.json?query-target=children&target-subtree-class=fvSubnet"
-            )
-            subnet_list = [
-                (data["fvSubnet"]["attributes"]["ip"], data["fvSubnet"]["attributes"]["scope"])
-                for data in resp.json()["imdata"]
-            ]
-            for subnet in subnet_list:
-                value.setdefault("subnets", [])
-                value["subnets"].append(subnet)
+            attrs = data["fvBD"]["attributes"]
+            bd = bd_dict.setdefault(attrs["name"], {})
+            bd["tenant"] = tenant_from_dn(attrs["dn"])
+            bd["description"] = attrs["descr"]
+            bd["unicast_routing"] = attrs["unicastRoute"]
+            bd["mac"] = attrs["mac"]
+            bd["l2unicast"] = attrs["unkMacUcastAct"]
+            for child in data["fvBD"].get("children", []):
+                if "fvRsCtx" in child:
+                    ctx_attrs = child["fvRsCtx"]["attributes"]
+                    bd["vrf"] = ctx_attrs.get("tnFvCtxName", "default")
+                    vrf_tenant = ctx_attrs.get("tDn", None)
+                    bd["vrf_tenant"] = tenant_from_dn(vrf_tenant) if vrf_tenant else None
+                elif "fvSubnet" in child:
+                    subnet_attrs = child["fvSubnet"]["attributes"]
+                    bd.setdefault("subnets", []).append((subnet_attrs["ip"], subnet_attrs["scope"]))
         return bd_dict
 
+    @staticmethod
+    def _parse_top_system_mgmt(attrs: dict) -> tuple:
+        """Derive the (oob_ip, subnet) pair from a topSystem object's attributes."""
+        if attrs["oobMgmtAddr"] != "0.0.0.0":  # nosec: B104
+            mgmt_addr = f"{attrs['oobMgmtAddr']}/{attrs['oobMgmtAddrMask']}"
+        elif attrs["address"] != "0.0.0.0" and attrs["tepPool"]:  # nosec: B104
+            mgmt_addr = f"{attrs['address']}/{_ip_network_cached(attrs['tepPool']).prefixlen}"
+        else:
+            mgmt_addr = ""
+        if attrs["tepPool"] != "0.0.0.0":  # nosec: B104
+            subnet = attrs["tepPool"]
+        elif mgmt_addr:
+            subnet = _ip_network_cached(mgmt_addr).with_prefixlen
+        else:
+            subnet = ""
+        return mgmt_addr, subnet
+
     def get_nodes(self) -> dict:
         """Return list of Leaf/Spine/FEXes nodes in the ACI fabric."""
-        resp = self._get('/api/class/fabricNode.json?query-target-filter=ne(fabricNode.role,"controller")')
+        # Filter to active nodes on the APIC itself so inactive ones are never transferred
+        resp = self._get(
+            "/api/class/fabricNode.json"
+            '?query-target-filter=and(ne(fabricNode.role,"controller"),eq(fabricNode.fabricSt,"active"))'
+        )
         node_dict = {}
         for node in resp.json()["imdata"]:
-            if node["fabricNode"]["attributes"]["fabricSt"] == "active":
-                node_id = node["fabricNode"]["attributes"]["id"]
-                node_dict[node_id] = {}
-                node_dict[node_id]["name"] = node["fabricNode"]["attributes"]["name"]
-                node_dict[node_id]["model"] = node["fabricNode"]["attributes"]["model"]
-                node_dict[node_id]["role"] = node["fabricNode"]["attributes"]["role"]
-                node_dict[node_id]["serial"] = node["fabricNode"]["attributes"]["serial"]
-                node_dict[node_id]["fabric_ip"] = node["fabricNode"]["attributes"]["address"]
-                node_dict[node_id]["pod_id"] = pod_from_dn(node["fabricNode"]["attributes"]["dn"])
+            attrs = node["fabricNode"]["attributes"]
+            node_id = attrs["id"]
+            node_dict[node_id] = {
+                "name": attrs["name"],
+                "model": attrs["model"],
+                "role": attrs["role"],
+                "serial": attrs["serial"],
+                "fabric_ip": attrs["address"],
+                "pod_id": pod_from_dn(attrs["dn"]),
+            }
         resp = self._get('/api/class/topSystem.json?query-target-filter=ne(topSystem.role,"controller")')
 
         for node in resp.json()["imdata"]:
-            if node["topSystem"]["attributes"]["oobMgmtAddr"] != "0.0.0.0":  # nosec: B104
-                mgmt_addr = f"{node['topSystem']['attributes']['oobMgmtAddr']}/{node['topSystem']['attributes']['oobMgmtAddrMask']}"
-            elif (
-                node["topSystem"]["attributes"]["address"] != "0.0.0.0"  # nosec: B104
-                and node["topSystem"]["attributes"]["tepPool"]
-            ):
-                mgmt_addr = f"{node['topSystem']['attributes']['address']}/{ip_network(node['topSystem']['attributes']['tepPool'], strict=False).prefixlen}"
-            else:
-                mgmt_addr = ""
-            if node["topSystem"]["attributes"]["tepPool"] != "0.0.0.0":  # nosec: B104
-                subnet = node["topSystem"]["attributes"]["tepPool"]
-            elif mgmt_addr:
-                subnet = ip_network(mgmt_addr, strict=False).with_prefixlen
-            else:
-                subnet = ""
-            node_id = node["topSystem"]["attributes"]["id"]
+            attrs = node["topSystem"]["attributes"]
+            mgmt_addr, subnet = self._parse_top_system_mgmt(attrs)
+            node_id = attrs["id"]
             node_dict[node_id]["oob_ip"] = mgmt_addr
             node_dict[node_id]["subnet"] = subnet
-            node_dict[node_id]["uptime"] = node["topSystem"]["attributes"]["systemUpTime"]
+            node_dict[node_id]["uptime"] = attrs["systemUpTime"]
 
         resp = self._get("/api/node/class/eqptExtCh.json")
 
@@ -437,26 +498,13 @@ class AciApi:
             node_dict[node_id]["site"] = self.site
         resp = self._get('/api/class/topSystem.json?query-target-filter=eq(topSystem.role,"controller")')
         for node in resp.json()["imdata"]:
-            if node["topSystem"]["attributes"]["oobMgmtAddr"] != "0.0.0.0":  # nosec: B104
-                mgmt_addr = f"{node['topSystem']['attributes']['oobMgmtAddr']}/{node['topSystem']['attributes']['oobMgmtAddrMask']}"
-            elif (
-                node["topSystem"]["attributes"]["address"] != "0.0.0.0"  # nosec: B104
-                and node["topSystem"]["attributes"]["tepPool"]
-            ):
-                mgmt_addr = f"{node['topSystem']['attributes']['address']}/{ip_network(node['topSystem']['attributes']['tepPool'], strict=False).prefixlen}"
-            else:
-                mgmt_addr = ""
-            if node["topSystem"]["attributes"]["tepPool"] != "0.0.0.0":  # nosec: B104
-                subnet = node["topSystem"]["attributes"]["tepPool"]
-            elif mgmt_addr:
-                subnet = ip_network(mgmt_addr, strict=False).with_prefixlen
-            else:
-                subnet = ""
-            node_id = node["topSystem"]["attributes"]["id"]
-            node_dict[node_id]["pod_id"] = node["topSystem"]["attributes"]["podId"]
+            attrs = node["topSystem"]["attributes"]
+            mgmt_addr, subnet = self._parse_top_system_mgmt(attrs)
+            node_id = attrs["id"]
+            node_dict[node_id]["pod_id"] = attrs["podId"]
             node_dict[node_id]["oob_ip"] = mgmt_addr
             node_dict[node_id]["subnet"] = subnet
-            node_dict[node_id]["uptime"] = node["topSystem"]["attributes"]["systemUpTime"]
+            node_dict[node_id]["uptime"] = attrs["systemUpTime"]
         return node_dict
 
     def get_pending_nodes(self) -> dict:
@@ -488,50 +536,37 @@ class AciApi:
             intf_dict[item] = {}
 
         for intf in resp.json()["imdata"]:
-            if int(fex_id_from_dn(intf["l1PhysIf"]["attributes"]["dn"])) < 100:
-                switch_id = node_from_dn(intf["l1PhysIf"]["attributes"]["dn"])
-            else:
-                switch_id = node_from_dn(intf["l1PhysIf"]["attributes"]["dn"]) + fex_id_from_dn(
-                    intf["l1PhysIf"]["attributes"]["dn"]
-                )
-            port_name = interface_from_dn(intf["l1PhysIf"]["attributes"]["dn"])
-            if "children" in intf["l1PhysIf"]:
-                intf_dict[switch_id][port_name] = {}
-                intf_dict[switch_id][port_name]["descr"] = intf["l1PhysIf"]["attributes"]["descr"]
-                intf_dict[switch_id][port_name]["speed"] = intf["l1PhysIf"]["attributes"]["speed"]
-                intf_dict[switch_id][port_name]["bw"] = intf["l1PhysIf"]["attributes"]["bw"]
-                intf_dict[switch_id][port_name]["usage"] = intf["l1PhysIf"]["attributes"]["usage"]
-                intf_dict[switch_id][port_name]["layer"] = intf["l1PhysIf"]["attributes"]["layer"]
-                intf_dict[switch_id][port_name]["mode"] = intf["l1PhysIf"]["attributes"]["mode"]
-                intf_dict[switch_id][port_name]["switchingSt"] = intf["l1PhysIf"]["attributes"]["switchingSt"]
-                intf_dict[switch_id][port_name]["state"] = intf["l1PhysIf"]["children"][0]["ethpmPhysIf"]["attributes"][
-                    "operSt"
-                ]
-                intf_dict[switch_id][port_name]["state_reason"] = intf["l1PhysIf"]["children"][0]["ethpmPhysIf"][
-                    "attributes"
-                ]["operStQual"]
-                intf_dict[switch_id][port_name]["gbic_sn"] = intf["l1PhysIf"]["children"][0]["ethpmPhysIf"]["children"][
-                    0
-                ]["ethpmFcot"]["attributes"]["guiSN"]
-                intf_dict[switch_id][port_name]["gbic_vendor"] = intf["l1PhysIf"]["children"][0]["ethpmPhysIf"][
-                    "children"
-                ][0]["ethpmFcot"]["attributes"]["guiName"]
-                intf_dict[switch_id][port_name]["gbic_type"] = intf["l1PhysIf"]["children"][0]["ethpmPhysIf"][
-                    "children"
-                ][0]["ethpmFcot"]["attributes"]["guiPN"]
-                if (
-                    intf["l1PhysIf"]["children"][0]["ethpmPhysIf"]["children"][0]["ethpmFcot"]["attributes"][
-                        "guiCiscoPID"
-                    ]
-                    != ""
-                ):
-                    intf_dict[switch_id][port_name]["gbic_model"] = intf["l1PhysIf"]["children"][0]["ethpmPhysIf"][
-                        "children"
-                    ][0]["ethpmFcot"]["attributes"]["typeName"]
-                else:
-                    intf_dict[switch_id][port_name]["gbic_model"] = intf["l1PhysIf"]["children"][0]["ethpmPhysIf"][
-                        "children"
-                    ][0]["ethpmFcot"]["attributes"]["guiCiscoPID"]
+            phys_if = intf["l1PhysIf"]
+            children = phys_if.get("children")
+            if not children:
+                continue
+            attrs = phys_if["attributes"]
+            # Run each regex-backed DN parser once per interface
+            dn = attrs["dn"]
+            fex_id = fex_id_from_dn(dn)
+            node_id = node_from_dn(dn)
+            switch_id = node_id if int(fex_id) < 100 else node_id + fex_id
+            port_name = interface_from_dn(dn)
+            ethpm = children[0]["ethpmPhysIf"]
+            ethpm_attrs = ethpm["attributes"]
+            fcot_attrs = ethpm["children"][0]["ethpmFcot"]["attributes"]
+            intf_dict[switch_id][port_name] = {
+                "descr": attrs["descr"],
+                "speed": attrs["speed"],
+                "bw": attrs["bw"],
+                "usage": attrs["usage"],
+                "layer": attrs["layer"],
+                "mode": attrs["mode"],
+                "switchingSt": attrs["switchingSt"],
+                "state": ethpm_attrs["operSt"],
+                "state_reason": ethpm_attrs["operStQual"],
+                "gbic_sn": fcot_attrs["guiSN"],
+                "gbic_vendor": fcot_attrs["guiName"],
+                "gbic_type": fcot_attrs["guiPN"],
+                # Prefer the Cisco PID, fall back to the transceiver type name. The old
+                # branching was inverted and returned "" whenever the PID was unset.
+                "gbic_model": fcot_attrs["guiCiscoPID"] or fcot_attrs["typeName"],
+            }
 
         return intf_dict
 
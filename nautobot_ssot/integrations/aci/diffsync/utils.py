@@ -6,41 +6,43 @@ import yaml
 
 logger = logging.getLogger(__name__)
 
+# Precompiled once at import; the DN parsers below run per object in sync hot loops.
+POD_RE = re.compile(r"/pod-(?P<pod>\d+)")
+NODE_RE = re.compile(r"/node-(?P<node>\d+)")
+INTERFACE_RE = re.compile(r"phys-.(?P<int>.*).")
+FEX_ID_RE = re.compile(r"phys-.eth(?P<fex>\d*)/.+")
+TENANT_RE = re.compile(r"tn-(.+?)/")
+AP_RE = re.compile(r"ap-[A-Za-z0-9\-]+")
+
 
 def pod_from_dn(dn):
     """Match an ACI pod_id in the Distiguished Name (DN)."""
-    pattern = r"/pod-(?P<pod>\d+)"
-    return (re.search(pattern, dn)).group("pod")
+    return POD_RE.search(dn).group("pod")
 
 
 def node_from_dn(dn):
     """Match an ACI node_id in the Distiguished Name (DN)."""
-    pattern = r"/node-(?P<node>\d+)"
-    return (re.search(pattern, dn)).group("node")
+    return NODE_RE.search(dn).group("node")
 
 
 def interface_from_dn(dn):
     """Match an ACI port in the Distiguished Name (DN)."""
-    pattern = r"phys-.(?P<int>.*)."
-    return (re.search(pattern, dn)).group("int")
+    return INTERFACE_RE.search(dn).group("int")
 
 
 def fex_id_from_dn(dn):
     """Match an ACI fex_id from port in the Distiguished Name (DN)."""
-    pattern = r"phys-.eth(?P<fex>\d*)/.+"
-    return (re.search(pattern, dn)).group("fex")
+    return FEX_ID_RE.search(dn).group("fex")
 
 
 def tenant_from_dn(dn):
     """Match an ACI tenant in the Distiguished Name (DN)."""
-    pattern = "tn-(.+?)\/"  # noqa: W605  # pylint: disable=anomalous-backslash-in-string
-    return re.search(pattern, dn).group().replace("tn-", "", 1).rstrip("/")
+    return TENANT_RE.search(dn).group().replace("tn-", "", 1).rstrip("/")
 
 
 def ap_from_dn(dn):
     """Match an ACI Application Profile in the Distinguished Name (DN)."""
-    pattern = "ap-[A-Za-z0-9\-]+"  # noqa: W605 # pylint: disable=anomalous-backslash-in-string
-    return re.search(pattern, dn).group().replace("ap-", "", 1).rstrip("/")
+    return AP_RE.search(dn).group().replace("ap-", "", 1).rstrip("/")
 
 
 def load_yamlfile(filename):
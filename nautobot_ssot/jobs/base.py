@@ -50,6 +50,10 @@ class DataSyncBaseJob(Job):  # pylint: disable=too-many-instance-attributes
     dryrun = DryRunVar(description="Perform a dry-run, making no actual changes to Nautobot data.", default=True)
     memory_profiling = BooleanVar(description="Perform a memory profiling analysis.", default=False)
 
+    # Number of SyncLogEntry records to buffer before writing them out in a single bulk_create().
+    # Subclasses may override; row-by-row inserts are the dominant database cost of a large sync.
+    sync_log_batch_size = 1000
+
     def load_source_adapter(self):
         """Method to instantiate and load the SOURCE adapter into `self.source_adapter`.
 
@@ -208,19 +212,34 @@ class DataSyncBaseJob(Job):  # pylint: disable=too-many-instance-attributes
         synced_object=None,
         object_repr="",
     ):
-        """Log a action message as a SyncLogEntry."""
+        """Log a action message as a SyncLogEntry.
+
+        Entries are buffered and written to the database in batches of `sync_log_batch_size`
+        (with a final flush when the job finishes) to avoid one INSERT per diffed object.
+        """
         if synced_object and not object_repr:
             object_repr = repr(synced_object)
 
-        SyncLogEntry.objects.create(
-            sync=self.sync,
-            action=action,
-            status=status,
-            message=message,
-            diff=diff,
-            synced_object=synced_object,
-            object_repr=object_repr,
+        self._sync_log_buffer.append(
+            SyncLogEntry(
+                sync=self.sync,
+                action=action,
+                status=status,
+                message=message,
+                diff=diff,
+                synced_object=synced_object,
+                object_repr=object_repr,
+            )
         )
+        if len(self._sync_log_buffer) >= self.sync_log_batch_size:
+            self._flush_sync_log()
+
+    def _flush_sync_log(self):
+        """Write any buffered SyncLogEntry records to the database in bulk."""
+        if not self._sync_log_buffer:
+            return
+        SyncLogEntry.objects.bulk_create(self._sync_log_buffer, batch_size=self.sync_log_batch_size)
+        self._sync_log_buffer = []
 
     def _structlog_to_sync_log_entry(self, _logger, _log_method, event_dict):
         """Capture certain structlog messages from DiffSync into the Nautobot database."""
@@ -261,6 +280,7 @@ class DataSyncBaseJob(Job):  # pylint: disable=too-many-instance-attributes
         super().__init__()
         self.sync = None
         self.diff = None
+        self._sync_log_buffer = []
         self.source_adapter = None
         self.target_adapter = None
         # Default diffsync flags. You can overwrite them at any time.
@@ -313,7 +333,10 @@ class DataSyncBaseJob(Job):  # pylint: disable=too-many-instance-attributes
             wrapper_class=structlog.stdlib.BoundLogger,
             cache_logger_on_first_use=True,
         )
-        self.sync_data(memory_profiling)
+        try:
+            self.sync_data(memory_profiling)
+        finally:
+            self._flush_sync_log()
 
 
 # pylint: disable=abstract-method
@@ -2,7 +2,8 @@
 
 from django.db import migrations, models
 import django.db.models.deletion
-import uuid
+
+import nautobot_ssot.utils
 
 
 class Migration(migrations.Migration):
@@ -20,7 +21,7 @@ class Migration(migrations.Migration):
                 (
                     "id",
                     models.UUIDField(
-                        default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True
+                        default=nautobot_ssot.utils.uuid7, editable=False, primary_key=True, serialize=False
                     ),
                 ),
                 ("source", models.CharField(max_length=64)),
@@ -45,7 +46,7 @@ class Migration(migrations.Migration):
                 (
                     "id",
                     models.UUIDField(
-                        default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True
+                        default=nautobot_ssot.utils.uuid7, editable=False, primary_key=True, serialize=False
                     ),
                 ),
                 ("timestamp", models.DateTimeField(auto_now_add=True)),
@@ -0,0 +1,14 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("nautobot_ssot", "0008_auto_20240110_1019"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="synclogentry",
+            index=models.Index(fields=["sync", "timestamp"], name="syncle_sync_ts_idx"),
+        ),
+    ]
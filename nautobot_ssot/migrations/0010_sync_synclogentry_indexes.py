@@ -0,0 +1,18 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("nautobot_ssot", "0009_synclogentry_sync_timestamp_index"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="sync",
+            index=models.Index(fields=["start_time"], name="ssot_sync_start_time"),
+        ),
+        migrations.AddIndex(
+            model_name="synclogentry",
+            index=models.Index(fields=["synced_object_type", "synced_object_id"], name="ssot_syncle_ct_obj"),
+        ),
+    ]
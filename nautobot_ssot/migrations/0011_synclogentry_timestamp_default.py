@@ -0,0 +1,16 @@
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("nautobot_ssot", "0010_sync_synclogentry_indexes"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="synclogentry",
+            name="timestamp",
+            field=models.DateTimeField(default=django.utils.timezone.now, editable=False),
+        ),
+    ]
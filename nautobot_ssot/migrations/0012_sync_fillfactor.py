@@ -0,0 +1,25 @@
+from django.db import migrations
+
+
+def set_fillfactor(apps, schema_editor):
+    """Leave free space in Sync table pages so repeated per-phase updates stay HOT (PostgreSQL only)."""
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("ALTER TABLE nautobot_ssot_sync SET (fillfactor = 80)")
+
+
+def reset_fillfactor(apps, schema_editor):
+    """Restore the default fillfactor (PostgreSQL only)."""
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("ALTER TABLE nautobot_ssot_sync RESET (fillfactor)")
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("nautobot_ssot", "0011_synclogentry_timestamp_default"),
+    ]
+
+    operations = [
+        migrations.RunPython(set_fillfactor, reset_fillfactor),
+    ]
@@ -0,0 +1,20 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("nautobot_ssot", "0012_sync_fillfactor"),
+    ]
+
+    operations = [
+        # State-only: base_manager_name routes related-object loads through the
+        # eager-loading manager and involves no schema change.
+        migrations.AlterModelOptions(
+            name="synclogentry",
+            options={
+                "base_manager_name": "objects",
+                "ordering": ["sync", "timestamp"],
+                "verbose_name_plural": "sync log entries",
+            },
+        ),
+    ]
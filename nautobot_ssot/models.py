@@ -27,7 +27,8 @@ from django.urls import reverse
 from django.utils.formats import date_format
 from django.utils.timezone import now
 
-from nautobot.core.models import BaseModel
+from nautobot.core.models import BaseManager, BaseModel
+from nautobot.core.models.querysets import RestrictedQuerySet
 from nautobot.extras.choices import JobResultStatusChoices
 from nautobot.extras.models import JobResult
 from nautobot.extras.utils import extras_features
@@ -35,6 +36,7 @@ from nautobot.extras.utils import extras_features
 from nautobot_ssot.integrations.servicenow.models import SSOTServiceNowConfig
 
 from .choices import SyncLogEntryActionChoices, SyncLogEntryStatusChoices
+from .utils import uuid7
 
 
 class DiffJSONEncoder(DjangoJSONEncoder):
@@ -43,7 +45,9 @@ class DiffJSONEncoder(DjangoJSONEncoder):
     def default(self, o):
         """Custom JSON encoder for the Sync.diff field."""
         if isinstance(o, set):
-            return self.encode(list(o))
+            # Return the list itself rather than self.encode()-ing it; encoding here would
+            # serialize the set twice and store it as an embedded JSON string.
+            return list(o)
         return super().default(o)
 
 
@@ -56,6 +60,9 @@ class Sync(BaseModel):  # pylint: disable=nb-string-field-blank-null
     Essentially an extension of the JobResult model to add a few additional fields.
     """
 
+    # Time-ordered primary keys keep the B-tree index append-mostly as syncs accumulate
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)  # noqa: A003
+
     source = models.CharField(max_length=64, help_text="System data is read from")
     target = models.CharField(max_length=64, help_text="System data is written to")
 
@@ -86,6 +93,10 @@ class Sync(BaseModel):  # pylint: disable=nb-string-field-blank-null
         """Metaclass attributes of Sync model."""
 
         ordering = ["start_time"]
+        indexes = [
+            # Serve the default ordering of sync listings without a sort step
+            models.Index(fields=["start_time"], name="ssot_sync_start_time"),
+        ]
 
     def __str__(self):
         """String representation of a Sync instance."""
@@ -98,10 +109,11 @@ class Sync(BaseModel):  # pylint: disable=nb-string-field-blank-null
     @classmethod
     def annotated_queryset(cls):
         """Construct an efficient queryset for this model and related data."""
+        # The per-action/status counters below are annotations, so the log rows themselves
+        # are never needed here — prefetching them would pull every entry of every sync.
         return (
             cls.objects.defer("diff")
             .select_related("job_result")
-            .prefetch_related("logs")
             .annotate(
                 num_unchanged=models.Count(
                     "log", filter=models.Q(log__action=SyncLogEntryActionChoices.ACTION_NO_CHANGE)
@@ -146,6 +158,22 @@ class Sync(BaseModel):  # pylint: disable=nb-string-field-blank-null
         )
 
 
+class SyncLogEntryManager(BaseManager.from_queryset(RestrictedQuerySet)):
+    """Default manager for SyncLogEntry records.
+
+    Log listings always render the parent sync and the synced object's content-type, so join
+    them eagerly by default rather than relying on each caller to remember select_related().
+    """
+
+    def get_queryset(self):
+        """Eagerly load the foreign keys rendered by every log listing.
+
+        The parent sync's diff blob can run to megabytes and is never rendered alongside
+        log entries, so keep it deferred rather than joining a copy onto every row.
+        """
+        return super().get_queryset().select_related("sync", "synced_object_type").defer("sync__diff")
+
+
 class SyncLogEntry(BaseModel):  # pylint: disable=nb-string-field-blank-null
     """Record of a single event during a data sync operation.
 
@@ -161,8 +189,13 @@ class SyncLogEntry(BaseModel):  # pylint: disable=nb-string-field-blank-null
     the data isn't changing in Nautobot, so there will be no ObjectChange record.
     """
 
+    # Time-ordered primary keys keep the B-tree index append-mostly on this insert-heavy table
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)  # noqa: A003
+
     sync = models.ForeignKey(to=Sync, on_delete=models.CASCADE, related_name="logs", related_query_name="log")
-    timestamp = models.DateTimeField(auto_now_add=True)
+    # Python-side default (not auto_now_add) so entries buffered for bulk_create() keep the
+    # timestamp of when they were logged rather than when the batch was flushed.
+    timestamp = models.DateTimeField(default=now, editable=False)
 
     action = models.CharField(max_length=32, choices=SyncLogEntryActionChoices)
     status = models.CharField(max_length=32, choices=SyncLogEntryStatusChoices)
@@ -181,11 +214,23 @@ class SyncLogEntry(BaseModel):  # pylint: disable=nb-string-field-blank-null
 
     message = models.TextField(blank=True)
 
+    objects = SyncLogEntryManager()
+
     class Meta:
         """Metaclass attributes of SyncLogEntry."""
 
         verbose_name_plural = "sync log entries"
         ordering = ["sync", "timestamp"]
+        # Route Django's internal related-object loads through the eager-loading manager too.
+        # Safe as a base manager only because its queryset keeps sync__diff deferred; an
+        # enriched base manager that joined the full parent row would bloat cascade deletes.
+        base_manager_name = "objects"
+        indexes = [
+            # Serve the default ordering (log listings per sync) as an index range scan
+            models.Index(fields=["sync", "timestamp"], name="syncle_sync_ts_idx"),
+            # Accelerate "all log entries for this object" lookups on the generic FK pair
+            models.Index(fields=["synced_object_type", "synced_object_id"], name="ssot_syncle_ct_obj"),
+        ]
 
     def get_action_class(self):
         """Map self.action to a Bootstrap label class."""
@@ -158,11 +158,6 @@ class TestAciMethods(unittest.TestCase):  # pylint: disable=too-many-public-meth
     @patch.object(AciApi, "_login")
     def test_get_contract_filters(self, mocked_login, mocked_handle_request):
         """Test get_contract_filters method."""
-        mock_vzSubj = Mock()
-        mock_vzSubj.json.return_value = {
-            "imdata": [{"vzSubj": {"attributes": {"dn": "uni/tn-test-tenant/brc-test-contract/subj-web"}}}]
-        }
-
         mock_vzRsSubjFiltAtt = Mock()
         mock_vzRsSubjFiltAtt.json.return_value = {
             "imdata": [
@@ -182,7 +177,7 @@ class TestAciMethods(unittest.TestCase):  # pylint: disable=too-many-public-meth
             "imdata": [{"vzEntry": {"attributes": {"name": "web", "dToPort": 80, "etherT": "ip", "prot": "tcp"}}}]
         }
         mocked_login.return_value = self.mock_login
-        mocked_handle_request.side_effect = [mock_vzSubj, mock_vzRsSubjFiltAtt, mock_vzEntry]
+        mocked_handle_request.side_effect = [mock_vzRsSubjFiltAtt, mock_vzEntry]
 
         expected_data = [{"name": "web", "dstport": 80, "etype": "ip", "prot": "tcp", "action": "permit"}]
 
@@ -360,9 +355,6 @@ class TestAciMethods(unittest.TestCase):  # pylint: disable=too-many-public-meth
             ]
         }
 
-        mocked_physDomP = Mock()
-        mocked_physDomP.json.return_value = {"imdata": [{"physDomP": {"attributes": {"name": "PHYS"}}}]}
-
         mocked_get_bd_subnet.return_value = "10.1.1.1/24"
         mocked_get_contract_filters.side_effect = [
             [{"name": "mysql", "dstport": "3306", "etype": "ip", "prot": "tcp", "action": "permit"}],
@@ -382,7 +374,7 @@ class TestAciMethods(unittest.TestCase):  # pylint: disable=too-many-public-meth
         ]
 
         mocked_login.return_value = self.mock_login
-        mocked_handle_request.side_effect = [mocked_epg, mocked_physDomP]
+        mocked_handle_request.side_effect = [mocked_epg]
 
         expected_data = {
             "bd": "Vlan101_App",
@@ -468,7 +460,15 @@ class TestAciMethods(unittest.TestCase):  # pylint: disable=too-many-public-meth
                             "unicastRoute": "yes",
                             "mac": "00:22:BD:F8:19:FF",
                             "unkMacUcastAct": "proxy",
-                        }
+                        },
+                        "children": [
+                            {
+                                "fvRsCtx": {
+                                    "attributes": {"tnFvCtxName": "vrf1", "tDn": "uni/tn-ntc-chatops/ctx-vrf1"}
+                                }
+                            },
+                            {"fvSubnet": {"attributes": {"ip": "10.1.1.1/24", "scope": "public"}}},
+                        ],
                     }
                 },
                 {
@@ -480,44 +480,22 @@ class TestAciMethods(unittest.TestCase):  # pylint: disable=too-many-public-meth
                             "unicastRoute": "yes",
                             "mac": "00:22:BD:F8:19:FF",
                             "unkMacUcastAct": "proxy",
-                        }
+                        },
+                        "children": [
+                            {
+                                "fvRsCtx": {
+                                    "attributes": {"tnFvCtxName": "vrf2", "tDn": "uni/tn-ntc-chatops/ctx-vrf1"}
+                                }
+                            },
+                            {"fvSubnet": {"attributes": {"ip": "10.2.2.2/24", "scope": "public"}}},
+                        ],
                     }
                 },
             ]
         }
 
-        mocked_fvRsCtx_1 = Mock()
-        mocked_fvRsCtx_1.status_code = 200
-        mocked_fvRsCtx_1.json.return_value = {
-            "imdata": [{"fvRsCtx": {"attributes": {"tnFvCtxName": "vrf1", "tDn": "uni/tn-ntc-chatops/ctx-vrf1"}}}]
-        }
-
-        mocked_fvRsCtx_2 = Mock()
-        mocked_fvRsCtx_2.status_code = 200
-        mocked_fvRsCtx_2.json.return_value = {
-            "imdata": [{"fvRsCtx": {"attributes": {"tnFvCtxName": "vrf2", "tDn": "uni/tn-ntc-chatops/ctx-vrf1"}}}]
-        }
-
-        mocked_fvSubnet_1 = Mock()
-        mocked_fvSubnet_1.status_code = 200
-        mocked_fvSubnet_1.json.return_value = {
-            "imdata": [{"fvSubnet": {"attributes": {"ip": "10.1.1.1/24", "scope": "public"}}}]
-        }
-
-        mocked_fvSubnet_2 = Mock()
-        mocked_fvSubnet_2.status_code = 200
-        mocked_fvSubnet_2.json.return_value = {
-            "imdata": [{"fvSubnet": {"attributes": {"ip": "10.2.2.2/24", "scope": "public"}}}]
-        }
-
         mocked_login.return_value = self.mock_login
-        mocked_handle_request.side_effect = [
-            mocked_fvBD,
-            mocked_fvRsCtx_1,
-            mocked_fvSubnet_1,
-            mocked_fvRsCtx_2,
-            mocked_fvSubnet_2,
-        ]
+        mocked_handle_request.return_value = mocked_fvBD
 
         expected_data = {
             "Vlan100_Web": {
@@ -848,11 +826,11 @@ class TestAciMethods(unittest.TestCase):  # pylint: disable=too-many-public-meth
                                         {
                                             "ethpmFcot": {
                                                 "attributes": {
-                                                    "guiSN": "",
-                                                    "guiName": "",
-                                                    "guiPN": "",
-                                                    "guiCiscoPID": "",
-                                                    "typeName": "",
+                                                    "guiSN": "AVD2052A0BC",
+                                                    "guiName": "CISCO-AVAGO",
+                                                    "guiPN": "SFBR-709SMZ-CS1",
+                                                    "guiCiscoPID": "SFP-10G-SR",
+                                                    "typeName": "10Gbase-SR",
                                                 }
                                             }
                                         }
@@ -887,7 +865,7 @@ class TestAciMethods(unittest.TestCase):  # pylint: disable=too-many-public-meth
                                                     "guiName": "",
                                                     "guiPN": "",
                                                     "guiCiscoPID": "",
-                                                    "typeName": "",
+                                                    "typeName": "10Gbase-SR",
                                                 }
                                             }
                                         }
@@ -915,10 +893,11 @@ class TestAciMethods(unittest.TestCase):  # pylint: disable=too-many-public-meth
                     "switchingSt": "disabled",
                     "state": "down",
                     "state_reason": "admin-down",
-                    "gbic_sn": "",
-                    "gbic_vendor": "",
-                    "gbic_type": "",
-                    "gbic_model": "",
+                    "gbic_sn": "AVD2052A0BC",
+                    "gbic_vendor": "CISCO-AVAGO",
+                    "gbic_type": "SFBR-709SMZ-CS1",
+                    # The Cisco PID wins when the transceiver reports one
+                    "gbic_model": "SFP-10G-SR",
                 },
                 "eth1/2": {
                     "descr": "UCS-6348-2",
@@ -933,7 +912,8 @@ class TestAciMethods(unittest.TestCase):  # pylint: disable=too-many-public-meth
                     "gbic_sn": "",
                     "gbic_vendor": "",
                     "gbic_type": "",
-                    "gbic_model": "",
+                    # No PID reported, so the transceiver type name is used
+                    "gbic_model": "10Gbase-SR",
                 },
             }
         }
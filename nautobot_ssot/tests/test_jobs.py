@@ -55,6 +55,8 @@ class BaseJobTestCase(TransactionTestCase):
             synced_object=None,
             object_repr="Nothing to delete",
         )
+        # Log entries are buffered and bulk-created; flush to persist them
+        self.job._flush_sync_log()  # pylint: disable=protected-access
 
         self.assertEqual(2, SyncLogEntry.objects.count())
 
@@ -10,6 +10,24 @@ from nautobot.extras.choices import JobResultStatusChoices
 from nautobot.extras.models import Job, JobResult
 
 from nautobot_ssot.models import Sync
+from nautobot_ssot.utils import uuid7
+
+
+class UUID7TestCase(TestCase):
+    """Tests for the uuid7() primary key generator."""
+
+    def test_version_and_variant(self):
+        """Generated values are valid RFC 9562 version-7 UUIDs."""
+        value = uuid7()
+        self.assertEqual(value.version, 7)
+        self.assertEqual(value.variant, uuid.RFC_4122)
+
+    def test_time_ordering(self):
+        """Values generated over time sort in generation order."""
+        first = uuid7()
+        time.sleep(0.002)
+        second = uuid7()
+        self.assertLess(first, second)
 
 
 class SyncTestCase(TestCase):
@@ -93,6 +111,14 @@ class SyncTestCase(TestCase):
         expected = earliest_datetime.isoformat()
         self.assertEqual(actual, expected)
 
+    def test_diff_with_set(self):
+        """Test set objects in diff are serialized as JSON arrays."""
+        self.source_sync.diff = {"set": {"a"}}
+        self.source_sync.validated_save()
+        self.source_sync.refresh_from_db()
+        actual = self.source_sync.diff["set"]
+        self.assertEqual(actual, ["a"])
+
     def test_diff_with_uuid(self):
         """Test UUID objects in diff are serializable."""
         expected = "12345678-1234-5678-1234-567812345678"
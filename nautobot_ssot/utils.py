@@ -1,4 +1,22 @@
 """Utility functions for Nautobot SSoT App."""
 import logging
+import secrets
+import time
+import uuid
 
 logger = logging.getLogger("nautobot.ssot")
+
+
+def uuid7() -> uuid.UUID:
+    """Generate a time-ordered UUID (version 7, RFC 9562).
+
+    Unlike the fully random UUIDv4, a UUIDv7 leads with a 48-bit millisecond Unix timestamp,
+    so successive values sort (and therefore index) in creation order. This gives much better
+    B-tree locality for insert-heavy tables such as SyncLogEntry.
+    """
+    value = (time.time_ns() // 1_000_000) << 80  # unix_ts_ms occupies the top 48 bits
+    value |= 0x7 << 76  # version
+    value |= secrets.randbits(12) << 64  # rand_a
+    value |= 0x2 << 62  # variant
+    value |= secrets.randbits(62)  # rand_b
+    return uuid.UUID(int=value)
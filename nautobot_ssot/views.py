@@ -114,13 +114,13 @@ class SyncListView(ObjectListView):
 class SyncDeleteView(ObjectDeleteView):
     """View for deleting a single Sync record."""
 
-    queryset = Sync.objects.all()
+    queryset = Sync.objects.defer("diff").all()
 
 
 class SyncBulkDeleteView(BulkDeleteView):
     """View for bulk-deleting Sync records."""
 
-    queryset = Sync.objects.all()
+    queryset = Sync.objects.defer("diff").all()
     table = SyncTable
     filterset = SyncFilterSet
 
@@ -141,7 +141,7 @@ class SyncView(ObjectView):
 class SyncJobResultView(ObjectView):
     """View for the JobResult associated with a single Sync record."""
 
-    queryset = Sync.objects.all()
+    queryset = Sync.objects.defer("diff").all()
     template_name = "nautobot_ssot/sync_jobresult.html"
 
     def get_extra_context(self, request, instance):
@@ -163,7 +163,9 @@ class SyncLogEntriesView(ObjectListView):
 
     def get(self, request, pk):  # pylint: disable=arguments-differ
         """HTTP GET request handler."""
-        self.instance = get_object_or_404(Sync.objects.all(), pk=pk)  # pylint: disable=attribute-defined-outside-init
+        self.instance = get_object_or_404(
+            Sync.objects.defer("diff"), pk=pk
+        )  # pylint: disable=attribute-defined-outside-init
         self.queryset = SyncLogEntry.objects.filter(sync=self.instance)
 
         return super().get(request)